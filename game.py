@@ -122,6 +122,7 @@ class Game:
             # Initialize world
             self.logger.info("Creating world map...")
             self.world_map = WorldMap(2000, 2000)
+            self.world_map.on_resize(*self.screen.get_size())
             
             # Camera position
             self.camera_x = 0
@@ -435,6 +436,7 @@ class Game:
             # Create a world map with double the default size
             from world.world_map import WorldMap
             self.world_map = WorldMap(WORLD_SIZE, WORLD_SIZE)
+            self.world_map.on_resize(*self.screen.get_size())
             
             # Initialize camera position
             self.camera_x = self.world_map.width // 2
@@ -679,7 +681,7 @@ class Game:
             
             # Update UI elements
             if hasattr(self, 'hud'):
-                self.hud.update(dt)
+                self.hud.update(dt, current_time)
             
             # Check for shop interactions
             if self.shop_open and hasattr(self, 'shop'):
@@ -906,7 +908,7 @@ class Game:
             # Draw HUD
             try:
                 if hasattr(self, 'hud'):
-                    self.hud.draw(self.screen)
+                    self.hud.draw(self.screen, self.last_update_time)
             except Exception as e:
                 self.logger.error(f"Error drawing HUD: {e}")
             
@@ -1493,6 +1495,10 @@ class Game:
                 # Handle quit event
                 if event.type == pygame.QUIT:
                     return False
+                
+                # Keep the world map's cached screen size in sync
+                if event.type == pygame.VIDEORESIZE:
+                    self.world_map.on_resize(event.w, event.h)
                     
                 # Handle key events
                 if event.type == pygame.KEYDOWN:
@@ -1515,6 +1521,7 @@ class Game:
                     # Toggle fullscreen with Alt+Enter
                     if event.key == pygame.K_RETURN and (pygame.key.get_mods() & pygame.KMOD_ALT):
                         pygame.display.toggle_fullscreen()
+                        self.world_map.on_resize(*pygame.display.get_surface().get_size())
                 
                 # Handle state-specific events
                 if self.state == "menu":
@@ -1,5 +1,5 @@
 import pygame
-from utils.constants import COLORS, UI_SCALE
+from utils.constants import COLORS, UI_SCALE, get_ui_constants
 
 class Button:
     def __init__(self, x, y, width, height, text, color, size='medium'):
@@ -12,6 +12,12 @@ class Button:
         self.shadow_offset = int(4 * UI_SCALE)
 
     def draw(self, surface):
+        # Scale from the surface actually drawn on so sizes follow window resizes
+        # (cached per width, so this is a dict lookup per frame)
+        ui_scale = get_ui_constants(surface.get_width())['UI_SCALE']
+        self.corner_radius = int(10 * ui_scale)
+        self.shadow_offset = int(4 * ui_scale)
+        
         # Draw shadow
         shadow_rect = self.rect.move(self.shadow_offset, self.shadow_offset)
         pygame.draw.rect(surface, (30, 30, 30), shadow_rect, 
@@ -30,9 +36,9 @@ class Button:
 
         # Draw text
         font_size = {
-            'small': int(24 * UI_SCALE),
-            'medium': int(32 * UI_SCALE),
-            'large': int(40 * UI_SCALE)
+            'small': int(24 * ui_scale),
+            'medium': int(32 * ui_scale),
+            'large': int(40 * ui_scale)
         }[self.size]
         
         font = pygame.font.SysFont('arial', font_size)
@@ -1,6 +1,21 @@
 import pygame
 import math
-from utils.constants import COLORS, UI_SCALE, WINDOW_WIDTH, WINDOW_HEIGHT
+import logging
+from utils.constants import (
+    COLORS, COLOR_ACCENT, COLOR_BLACK, COLOR_BLUE, COLOR_GOLD, COLOR_GREEN, COLOR_HEALTH,
+    COLOR_PURPLE, COLOR_RED, COLOR_WHITE, COLOR_YELLOW, COLOR_YELLOW_DARK,
+    UI_SCALE, WINDOW_WIDTH, WINDOW_HEIGHT, STAT_ICONS_PATH
+)
+from utils.surfaces import convert_surface
+
+# One full sine period sampled at 256 steps, indexed by (ticks >> 3) & 0xFF
+_SIN_LUT = tuple(math.sin(2 * math.pi * i / 256) for i in range(256))
+
+# Stat icons in sprite sheet order (one square sprite per stat, left to right)
+_STAT_ICON_ORDER = ('damage', 'rate', 'speed', 'coins', 'kills')
+
+# Number of stat slots in the two-column stats panel
+_MAX_STATS = len(_STAT_ICON_ORDER)
 
 class HUD:
     def __init__(self, game):
@@ -11,31 +26,83 @@ class HUD:
         
         # Initialize all required attributes
         self.stats_flash = {}
-        self.xp_bar_current = 0
+        self._xp_q16 = 0  # Smoothed XP ratio in Q16.16 fixed point (65536 == full bar)
         self.wave_text_scale = 1.0
         self.coin_bounce = 0
         self.countdown_active = False
         self.countdown_end_time = 0
         self.last_update_time = pygame.time.get_ticks()
         
+        # Debug overlay is only re-rendered when one of its values changes
+        self._dbg_cache_key = None
+        self._dbg_surface = None
+        
+        # Stats panel background only depends on UI_SCALE, built on first draw
+        self._stats_panel_surf = None
+        
+        # Stat icon/value layout and font, computed once for the current UI_SCALE
+        self.stat_font = pygame.font.SysFont('arial', int(16 * UI_SCALE))
+        self._stat_icon_radius = int(12 * UI_SCALE)
+        self._stat_slots = self._build_stat_slots()
+        
+        # Stat icon sprite sheet, scaled once to fit inside the icon circles
+        self._icon_sheet = None
+        self._icon_rects = {}
+        self._icon_half = 0
+        self._load_stat_icons()
+        
         # Initialize any required game attributes if they don't exist
         if not hasattr(self.game, 'player_experience'):
             self.game.player_experience = 0
         if not hasattr(self.game, 'required_xp'):
             self.game.required_xp = 100
         
+    def _build_stat_slots(self):
+        """Precompute (icon_x, icon_y, label_x) for each stat slot, two per row"""
+        panel_width = int(250 * UI_SCALE)
+        padding = int(12 * UI_SCALE)
+        y_offset = padding * 6  # Below the XP and health bars
+        icon_size = int(20 * UI_SCALE)
+        spacing = int(28 * UI_SCALE)
+        radius = self._stat_icon_radius
+        
+        slots = []
+        for i in range(_MAX_STATS):
+            x_offset = padding * 2 + (i % 2) * (panel_width // 2)
+            y = y_offset + (i // 2) * spacing
+            slots.append((x_offset + radius, y + radius, x_offset + icon_size + padding * 1.5))
+        return slots
+    
+    def _load_stat_icons(self):
+        """Load the stat icon sprite sheet and slice it into per-stat source rects"""
+        try:
+            sheet = pygame.image.load(STAT_ICONS_PATH)
+        except (pygame.error, FileNotFoundError) as e:
+            logging.error(f"Error loading stat icons: {e}")
+            return
+        
+        size = self._stat_icon_radius * 3 // 2
+        sheet = pygame.transform.smoothscale(sheet, (size * len(_STAT_ICON_ORDER), size))
+        self._icon_sheet = convert_surface(sheet, alpha=True)
+        self._icon_rects = {key: pygame.Rect(i * size, 0, size, size) for i, key in enumerate(_STAT_ICON_ORDER)}
+        self._icon_half = size // 2
+    
     def start_countdown(self, duration):
         self.countdown_active = True
         self.countdown_end_time = pygame.time.get_ticks() / 1000.0 + duration
         
-    def draw(self, screen):
+    def draw(self, screen, now_ms=None):
         """Draw all HUD elements with error handling"""
         try:
+            # Sample the clock once per frame and share it with every draw path
+            if now_ms is None:
+                now_ms = pygame.time.get_ticks()
+            
             # Check if player exists
             if not hasattr(self.game, 'player'):
                 # Draw a message if player doesn't exist
                 font = pygame.font.Font(None, 36)
-                text = font.render("Player not initialized", True, COLORS.get('red', (255, 0, 0)))
+                text = font.render("Player not initialized", True, COLOR_RED)
                 screen.blit(text, (WINDOW_WIDTH // 2 - 100, 20))
                 return
             
@@ -58,7 +125,7 @@ class HUD:
             
             # Draw countdown if active
             if self.countdown_active:
-                self.draw_countdown(screen)
+                self.draw_countdown(screen, now_ms)
             
             # Draw debug overlay if debug mode is enabled
             if hasattr(self.game, 'debug_mode') and self.game.debug_mode:
@@ -76,15 +143,17 @@ class HUD:
             except:
                 pass
 
-    def draw_countdown(self, screen):
+    def draw_countdown(self, screen, now_ms=None):
         """Draw countdown timer"""
         try:
-            current_time = pygame.time.get_ticks() / 1000.0
+            if now_ms is None:
+                now_ms = pygame.time.get_ticks()
+            current_time = now_ms / 1000.0
             remaining = self.countdown_end_time - current_time
             if remaining > 0:
                 countdown_text = str(math.ceil(remaining))
                 font = pygame.font.Font(None, 74)
-                text = font.render(countdown_text, True, COLORS.get('warning', COLORS.get('yellow', (255, 255, 0))))
+                text = font.render(countdown_text, True, COLORS.get('warning', COLOR_YELLOW))
                 text_rect = text.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2))
                 screen.blit(text, text_rect)
             else:
@@ -105,18 +174,18 @@ class HUD:
             bar_height = 20
             bar_x = 20
             bar_y = 20
-            pygame.draw.rect(screen, COLORS.get('red', (255, 0, 0)), (bar_x, bar_y, bar_width, bar_height))
+            screen.fill(COLOR_RED, (bar_x, bar_y, bar_width, bar_height))
             
             # Draw current health (green portion)
             health_percent = max(0, min(1, self.game.player.health / self.game.player.max_health))
             health_width = int(bar_width * health_percent)
-            pygame.draw.rect(screen, COLORS.get('green', (0, 255, 0)), (bar_x, bar_y, health_width, bar_height))
+            screen.fill(COLOR_GREEN, (bar_x, bar_y, health_width, bar_height))
             
             # Draw border around health bar
-            pygame.draw.rect(screen, COLORS.get('white', (255, 255, 255)), (bar_x, bar_y, bar_width, bar_height), 2)
+            pygame.draw.rect(screen, COLOR_WHITE, (bar_x, bar_y, bar_width, bar_height), 2)
             
             # Draw health text
-            health_text = self.font.render(f"Health: {int(self.game.player.health)}/{int(self.game.player.max_health)}", True, COLORS.get('white', (255, 255, 255)))
+            health_text = self.font.render(f"Health: {int(self.game.player.health)}/{int(self.game.player.max_health)}", True, COLOR_WHITE)
             screen.blit(health_text, (bar_x + 10, bar_y + 2))
         except Exception as e:
             import logging
@@ -130,17 +199,17 @@ class HUD:
                 return
             
             # Draw wave text
-            wave_text = self.font.render(f"Wave: {self.game.wave_number}", True, COLORS.get('white', (255, 255, 255)))
+            wave_text = self.font.render(f"Wave: {self.game.wave_number}", True, COLOR_WHITE)
             screen.blit(wave_text, (20, 50))
             
             # Draw enemies left if enemies list exists
             if hasattr(self.game, 'enemies'):
-                enemies_text = self.font.render(f"Enemies: {len(self.game.enemies)}", True, COLORS.get('white', (255, 255, 255)))
+                enemies_text = self.font.render(f"Enemies: {len(self.game.enemies)}", True, COLOR_WHITE)
                 screen.blit(enemies_text, (20, 75))
             
             # Draw kill count if it exists
             if hasattr(self.game, 'kills'):
-                kills_text = self.font.render(f"Kills: {self.game.kills}", True, COLORS.get('white', (255, 255, 255)))
+                kills_text = self.font.render(f"Kills: {self.game.kills}", True, COLOR_WHITE)
                 screen.blit(kills_text, (20, 100))
         except Exception as e:
             import logging
@@ -154,7 +223,7 @@ class HUD:
                 return
             
             # Draw score text
-            score_text = self.font.render(f"Score: {self.game.score}", True, COLORS.get('white', (255, 255, 255)))
+            score_text = self.font.render(f"Score: {self.game.score}", True, COLOR_WHITE)
             screen.blit(score_text, (WINDOW_WIDTH - 150, 20))
         except Exception as e:
             import logging
@@ -172,11 +241,11 @@ class HUD:
             coin_icon_y = 50
             coin_radius = 8
             
-            pygame.draw.circle(screen, COLORS.get('gold', (255, 215, 0)), (coin_icon_x, coin_icon_y), coin_radius)
-            pygame.draw.circle(screen, COLORS.get('yellow_dark', (190, 160, 0)), (coin_icon_x, coin_icon_y), coin_radius, 1)
+            pygame.draw.circle(screen, COLOR_GOLD, (coin_icon_x, coin_icon_y), coin_radius)
+            pygame.draw.circle(screen, COLOR_YELLOW_DARK, (coin_icon_x, coin_icon_y), coin_radius, 1)
             
             # Draw coin count
-            coin_text = self.font.render(f"x {self.game.coins}", True, COLORS.get('white', (255, 255, 255)))
+            coin_text = self.font.render(f"x {self.game.coins}", True, COLOR_WHITE)
             screen.blit(coin_text, (coin_icon_x + 15, coin_icon_y - 8))
         except Exception as e:
             import logging
@@ -197,7 +266,7 @@ class HUD:
             
             # Draw mini-map background
             pygame.draw.rect(screen, COLORS.get('dark_gray', (50, 50, 50)), (map_x, map_y, map_width, map_height))
-            pygame.draw.rect(screen, COLORS.get('white', (255, 255, 255)), (map_x, map_y, map_width, map_height), 2)
+            pygame.draw.rect(screen, COLOR_WHITE, (map_x, map_y, map_width, map_height), 2)
             
             # Calculate scale factors
             scale_x = map_width / self.game.world_map.width
@@ -207,7 +276,7 @@ class HUD:
             if hasattr(self.game.player, 'pos'):
                 player_map_x = map_x + int(self.game.player.pos[0] * scale_x)
                 player_map_y = map_y + int(self.game.player.pos[1] * scale_y)
-                pygame.draw.circle(screen, COLORS.get('white', (255, 255, 255)), (player_map_x, player_map_y), 3)
+                pygame.draw.circle(screen, COLOR_WHITE, (player_map_x, player_map_y), 3)
             
             # Draw enemies on mini-map (small red dots)
             if hasattr(self.game, 'enemies'):
@@ -218,7 +287,7 @@ class HUD:
                         # Only draw if within map bounds
                         if (map_x <= enemy_map_x <= map_x + map_width and
                             map_y <= enemy_map_y <= map_y + map_height):
-                            pygame.draw.circle(screen, COLORS.get('red', (255, 0, 0)), (enemy_map_x, enemy_map_y), 2)
+                            pygame.draw.circle(screen, COLOR_RED, (enemy_map_x, enemy_map_y), 2)
             
             # Draw current view area on mini-map (white rectangle)
             if hasattr(self.game, 'camera_x') and hasattr(self.game, 'camera_y'):
@@ -226,7 +295,7 @@ class HUD:
                 view_y = map_y + int(self.game.camera_y * scale_y)
                 view_width = int(WINDOW_WIDTH * scale_x)
                 view_height = int(WINDOW_HEIGHT * scale_y)
-                pygame.draw.rect(screen, COLORS.get('white', (255, 255, 255)), 
+                pygame.draw.rect(screen, COLOR_WHITE, 
                                (view_x, view_y, view_width, view_height), 1)
         except Exception as e:
             import logging
@@ -246,24 +315,25 @@ class HUD:
             
             # Draw semi-transparent panel background with more opacity
             try:
-                panel_surface = pygame.Surface((panel_width, panel_height), pygame.SRCALPHA)
-                panel_color = COLORS.get('panel', (40, 40, 60, 200))
-                # Handle both RGB and RGBA color formats
-                if len(panel_color) == 3:
-                    panel_color = (*panel_color, 200)  # Add alpha if missing
-                pygame.draw.rect(panel_surface, panel_color, (0, 0, panel_width, panel_height), border_radius=12)
-                screen.blit(panel_surface, (padding, padding))
+                if self._stats_panel_surf is None:
+                    panel_surface = pygame.Surface((panel_width, panel_height), pygame.SRCALPHA)
+                    panel_color = COLORS.get('panel', (40, 40, 60, 200))
+                    # Handle both RGB and RGBA color formats
+                    if len(panel_color) == 3:
+                        panel_color = (*panel_color, 200)  # Add alpha if missing
+                    pygame.draw.rect(panel_surface, panel_color, (0, 0, panel_width, panel_height), border_radius=12)
+                    self._stats_panel_surf = convert_surface(panel_surface, alpha=True)
+                screen.blit(self._stats_panel_surf, (padding, padding))
             except Exception as panel_error:
                 logging.error(f"Error drawing stats panel: {panel_error}")
             
             # Experience bar at the very top
             try:
-                xp_ratio = self.game.player_experience / max(1, self.game.required_xp)  # Avoid division by zero
-                self.xp_bar_current += (xp_ratio - self.xp_bar_current) * 0.1
+                # Smoothing happens in update(); just draw the current fixed-point value
                 self.draw_bar(screen, padding * 2, padding * 2,
                              panel_width - padding * 3, int(10 * UI_SCALE),  # Slightly taller bars
-                             self.xp_bar_current, COLORS.get('accent', (100, 200, 255)),
-                             f"Level {getattr(self.game, 'level', 1)}")
+                             None, COLOR_ACCENT,
+                             f"Level {getattr(self.game, 'level', 1)}", ratio_q16=self._xp_q16)
             except Exception as xp_error:
                 logging.error(f"Error drawing XP bar: {xp_error}")
             
@@ -273,76 +343,72 @@ class HUD:
                     health_ratio = self.game.player.health / max(1, self.game.player.max_health)  # Avoid division by zero
                     self.draw_bar(screen, padding * 2, padding * 4,
                                  panel_width - padding * 3, int(10 * UI_SCALE),
-                                 health_ratio, COLORS.get('health', (0, 255, 0)),
+                                 health_ratio, COLOR_HEALTH,
                                  f"HP: {int(self.game.player.health)}/{int(self.game.player.max_health)}")
             except Exception as health_error:
                 logging.error(f"Error drawing health bar: {health_error}")
             
             # Stats with improved icons
             try:
-                y_offset = padding * 6  # Moved down to accommodate health bar
-                icon_size = int(20 * UI_SCALE)  # Larger icons
-                spacing = int(28 * UI_SCALE)  # Increased spacing
-                
                 # Only show stats that exist
                 stats = []
                 
                 if hasattr(self.game.player, 'bullet_damage'):
-                    stats.append(("🗡️", f"{self.game.player.bullet_damage:.1f}", COLORS.get('red', (255, 0, 0))))
+                    stats.append(('damage', f"{self.game.player.bullet_damage:.1f}", COLOR_RED))
                     
                 if hasattr(self.game.player, 'shoot_delay') and self.game.player.shoot_delay > 0:
-                    stats.append(("⚡", f"{(1000/self.game.player.shoot_delay):.1f}/s", COLORS.get('yellow', (255, 255, 0))))
+                    stats.append(('rate', f"{(1000/self.game.player.shoot_delay):.1f}/s", COLOR_YELLOW))
                     
                 if hasattr(self.game.player, 'speed'):
-                    stats.append(("👟", f"{self.game.player.speed:.1f}", COLORS.get('blue', (0, 0, 255))))
+                    stats.append(('speed', f"{self.game.player.speed:.1f}", COLOR_BLUE))
                     
                 if hasattr(self.game, 'coins'):
-                    stats.append(("💰", f"{self.game.coins}", COLORS.get('gold', (255, 215, 0))))
+                    stats.append(('coins', f"{self.game.coins}", COLOR_GOLD))
                     
                 if hasattr(self.game, 'kills'):
-                    stats.append(("💀", f"{self.game.kills}", COLORS.get('purple', (150, 50, 200))))
+                    stats.append(('kills', f"{self.game.kills}", COLOR_PURPLE))
                 
-                # Larger font for better readability
-                small_font = pygame.font.SysFont('arial', int(16 * UI_SCALE))
-                for i, (icon, value, color) in enumerate(stats):
-                    # Draw stat in two columns
-                    x_offset = padding * 2 + (i % 2) * (panel_width // 2)
-                    row = i // 2
-                    y = y_offset + row * spacing
+                white = COLOR_WHITE
+                icon_bg_radius = self._stat_icon_radius
+                icon_sheet = self._icon_sheet
+                icon_half = self._icon_half
+                blits = []
+                for (key, value, color), (icon_x, icon_y, label_x) in zip(stats, self._stat_slots):
+                    # Draw icon background circle now, queue the sprites for a single blits call
+                    pygame.draw.circle(screen, color, (icon_x, icon_y), icon_bg_radius)
+                    if icon_sheet is not None:
+                        blits.append((icon_sheet, (icon_x - icon_half, icon_y - icon_half), self._icon_rects[key]))
                     
-                    # Draw icon with background circle
-                    icon_bg_radius = int(12 * UI_SCALE)
-                    pygame.draw.circle(screen, color, (x_offset + icon_bg_radius, y + icon_bg_radius), icon_bg_radius)
-                    icon_text = small_font.render(icon, True, COLORS.get('white', (255, 255, 255)))
-                    icon_rect = icon_text.get_rect(center=(x_offset + icon_bg_radius, y + icon_bg_radius))
-                    screen.blit(icon_text, icon_rect)
-                    
-                    # Draw value with improved spacing
-                    value_text = small_font.render(str(value), True, COLORS.get('white', (255, 255, 255)))
-                    screen.blit(value_text, (x_offset + icon_size + padding * 1.5, y + icon_bg_radius - value_text.get_height()//2))
+                    # Value text, vertically centred on the icon
+                    value_text = self.stat_font.render(str(value), True, white)
+                    blits.append((value_text, (label_x, icon_y - value_text.get_height() // 2)))
+                screen.blits(blits, doreturn=False)
             except Exception as stats_error:
                 logging.error(f"Error drawing player stats: {stats_error}")
         except Exception as e:
             logging.error(f"Error in draw_main_stats: {e}")
 
-    def draw_bar(self, screen, x, y, width, height, ratio, color, text=""):
-        """Draw a progress bar with error handling"""
+    def draw_bar(self, screen, x, y, width, height, ratio, color, text="", ratio_q16=None):
+        """Draw a progress bar with error handling; ratio_q16 (0..65536) overrides ratio"""
         try:
             # Draw background with rounded corners
             pygame.draw.rect(screen, COLORS.get('dark_gray', (50, 50, 50)), (x, y, width, height), border_radius=height//2)
             
             # Draw filled portion with rounded corners
-            fill_width = int(width * max(0, min(1, ratio)))  # Clamp ratio between 0-1
+            if ratio_q16 is not None:
+                fill_width = (width * ratio_q16) >> 16  # Already clamped to 0..65536
+            else:
+                fill_width = int(width * max(0, min(1, ratio)))  # Clamp ratio between 0-1
             if fill_width > 0:
                 pygame.draw.rect(screen, color, (x, y, fill_width, height), border_radius=height//2)
             
             # Draw text if provided with improved visibility
             if text:
                 font = pygame.font.SysFont('arial', int(14 * UI_SCALE))
-                text_surface = font.render(text, True, COLORS.get('white', (255, 255, 255)))
+                text_surface = font.render(text, True, COLOR_WHITE)
                 text_rect = text_surface.get_rect(midleft=(x + 8, y + height // 2))
                 # Draw text shadow for better readability
-                shadow_surface = font.render(text, True, COLORS.get('black', (0, 0, 0)))
+                shadow_surface = font.render(text, True, COLOR_BLACK)
                 shadow_rect = shadow_surface.get_rect(midleft=(text_rect.left + 1, text_rect.centery + 1))
                 screen.blit(shadow_surface, shadow_rect)
                 screen.blit(text_surface, text_rect)
@@ -368,54 +434,80 @@ class HUD:
         # Placeholder for minimap implementation
         pass
 
-    def update(self, dt):
+    def update(self, dt, now_ms=None):
         """Update HUD elements"""
+        # Sample the clock once per frame
+        if now_ms is None:
+            now_ms = pygame.time.get_ticks()
+        
         # Update countdown if active
         if self.countdown_active:
-            current_time = pygame.time.get_ticks() / 1000.0
+            current_time = now_ms / 1000.0
             if current_time >= self.countdown_end_time:
                 self.countdown_active = False
             
         # Smoothly update XP bar
         if hasattr(self.game, 'player_experience') and hasattr(self.game, 'required_xp'):
-            target_ratio = self.game.player_experience / self.game.required_xp
-            self.xp_bar_current += (target_ratio - self.xp_bar_current) * 0.1
+            target_ratio = self.game.player_experience / max(1, self.game.required_xp)
+            target_q16 = int(max(0, min(1, target_ratio)) * 65536)
+            self._xp_q16 += (target_q16 - self._xp_q16) >> 3  # ~12.5% of the gap per frame
         
         # Update coin bounce animation
         self.coin_bounce = (self.coin_bounce + dt * 0.1) % (2 * math.pi)
         
         # Update wave text scale with pulsing effect
         if self.game.state == "playing":
-            self.wave_text_scale = 1.0 + math.sin(pygame.time.get_ticks() * 0.005) * 0.1
+            self.wave_text_scale = 1.0 + _SIN_LUT[(now_ms >> 3) & 0xFF] * 0.1
 
     def draw_debug_overlay(self, screen):
         """Draw debug information overlay"""
         try:
-            # Create a semi-transparent surface for debug info
-            debug_surface = pygame.Surface((400, 300), pygame.SRCALPHA)
-            debug_surface.fill((0, 0, 0, 150))  # Semi-transparent black
-            
-            # Debug text
-            debug_info = [
-                f"FPS: {getattr(self.game, 'current_fps', 0):.1f}",
-                f"Game State: {getattr(self.game, 'state', 'unknown')}",
-                f"Player Pos: {getattr(self.game.player, 'pos', [0, 0])}",
-                f"Camera: [{getattr(self.game, 'camera_x', 0):.1f}, {getattr(self.game, 'camera_y', 0):.1f}]",
-                f"Enemies: {len(getattr(self.game, 'enemies', []))}",
-                f"Projectiles: {len(getattr(self.game, 'projectiles', []))}",
-                f"Drops: {len(getattr(self.game, 'drops', []))}",
-                f"Wave: {getattr(self.game, 'wave_number', 0)}",
-                f"Shop Open: {getattr(self.game, 'shop_open', False)}"
-            ]
-            
-            # Draw debug info
-            font = pygame.font.Font(None, 20)
-            for i, info in enumerate(debug_info):
-                text = font.render(info, True, (255, 255, 255))
-                debug_surface.blit(text, (10, 10 + i * 20))
+            # Snapshot the displayed values, quantized the same way they are printed
+            key = (
+                round(getattr(self.game, 'current_fps', 0), 1),
+                getattr(self.game, 'state', 'unknown'),
+                tuple(getattr(self.game.player, 'pos', (0, 0))),
+                round(getattr(self.game, 'camera_x', 0), 1),
+                round(getattr(self.game, 'camera_y', 0), 1),
+                len(getattr(self.game, 'enemies', [])),
+                len(getattr(self.game, 'projectiles', [])),
+                len(getattr(self.game, 'drops', [])),
+                getattr(self.game, 'wave_number', 0),
+                getattr(self.game, 'shop_open', False)
+            )
+            
+            # Rebuild the overlay only when something on it changed
+            if key != self._dbg_cache_key or self._dbg_surface is None:
+                fps, state, pos, cam_x, cam_y, n_enemies, n_projectiles, n_drops, wave, shop_open = key
+                
+                # Create a semi-transparent surface for debug info
+                debug_surface = pygame.Surface((400, 300), pygame.SRCALPHA)
+                debug_surface.fill((0, 0, 0, 150))  # Semi-transparent black
+                
+                # Debug text
+                debug_info = [
+                    f"FPS: {fps:.1f}",
+                    f"Game State: {state}",
+                    f"Player Pos: {list(pos)}",
+                    f"Camera: [{cam_x:.1f}, {cam_y:.1f}]",
+                    f"Enemies: {n_enemies}",
+                    f"Projectiles: {n_projectiles}",
+                    f"Drops: {n_drops}",
+                    f"Wave: {wave}",
+                    f"Shop Open: {shop_open}"
+                ]
+                
+                # Draw debug info
+                font = pygame.font.Font(None, 20)
+                for i, info in enumerate(debug_info):
+                    text = font.render(info, True, (255, 255, 255))
+                    debug_surface.blit(text, (10, 10 + i * 20))
+                
+                self._dbg_surface = convert_surface(debug_surface, alpha=True)
+                self._dbg_cache_key = key
             
             # Draw the debug surface in the bottom-left corner
-            screen.blit(debug_surface, (10, WINDOW_HEIGHT - 310))
+            screen.blit(self._dbg_surface, (10, WINDOW_HEIGHT - 310))
         except Exception as e:
             import logging
             logging.error(f"Error drawing debug overlay: {e}")
@@ -1,6 +1,7 @@
 import pygame
-from utils.constants import COLORS, WINDOW_WIDTH, WINDOW_HEIGHT, UI_SCALE
+from utils.constants import COLORS, COLOR_GOLD, COLOR_RED, COLOR_WHITE, WINDOW_WIDTH, WINDOW_HEIGHT, UI_SCALE
 from ui.button import Button
+from utils.surfaces import convert_surface
 
 class ShopItem:
     def __init__(self, x, y, width, height, name, base_cost, effect_func, color, 
@@ -52,7 +53,7 @@ class Shop:
             20, 
             20, 
             "X", 
-            COLORS['red'], 
+            COLOR_RED, 
             'small'
         )
         
@@ -88,6 +89,28 @@ class Shop:
             }
         ]
         
+        # Item rects in item order, so a single collidelist call finds the hit index
+        self._rects = [item['rect'] for item in self.items]
+        
+        # Prebuilt item panels (background + border) so each item is a single blit
+        item_size = self.items[0]['rect'].size
+        self._item_panel_normal = self._build_item_panel(item_size, COLORS.get('dark_gray', (50, 50, 50)))
+        self._item_panel_hover = self._build_item_panel(item_size, COLORS.get('gray', (100, 100, 100)))
+        
+        # Item name and description never change, so render them once
+        self._item_text = [
+            (convert_surface(self.font.render(item['name'], True, COLOR_WHITE), alpha=True),
+             convert_surface(self.font.render(item['description'], True, COLORS.get('light_gray', (200, 200, 200))), alpha=True))
+            for item in self.items
+        ]
+    
+    def _build_item_panel(self, size, color):
+        """Render an item background with its border into a standalone surface"""
+        panel = pygame.Surface(size)
+        panel.fill(color)
+        pygame.draw.rect(panel, COLOR_WHITE, panel.get_rect(), 1)
+        return convert_surface(panel)
+        
     def draw(self, screen):
         """Draw shop interface"""
         if not self.visible:
@@ -96,47 +119,38 @@ class Shop:
             return
             
         # Draw shop background panel
-        pygame.draw.rect(screen, COLORS['dark_gray'], 
-                       (self.x, self.y, self.width, self.height))
-        pygame.draw.rect(screen, COLORS['white'], 
+        screen.fill(COLORS.get('dark_gray', (50, 50, 50)), 
+                    (self.x, self.y, self.width, self.height))
+        pygame.draw.rect(screen, COLOR_WHITE, 
                        (self.x, self.y, self.width, self.height), 2)
         
         # Draw title
-        title = self.title_font.render("Shop", True, COLORS['white'])
+        title = self.title_font.render("Shop", True, COLOR_WHITE)
         screen.blit(title, (self.x + 10, self.y + 10))
         
         # Draw close button
         self.close_button.draw(screen)
         
         # Draw coins display
-        coin_text = self.font.render(f"Coins: {self.game.coins}", True, COLORS['gold'])
+        coin_text = self.font.render(f"Coins: {self.game.coins}", True, COLOR_GOLD)
         screen.blit(coin_text, (self.x + 10, self.y + 40))
         
         # Draw items
-        for item in self.items:
-            # Highlight if mouse is over item
-            mouse_pos = pygame.mouse.get_pos()
-            if item['rect'].collidepoint(mouse_pos):
-                # Brighter background for hover
-                pygame.draw.rect(screen, COLORS['gray'], item['rect'])
-            else:
-                # Normal background
-                pygame.draw.rect(screen, COLORS['dark_gray'], item['rect'])
-                
-            # Draw border
-            pygame.draw.rect(screen, COLORS['white'], item['rect'], 1)
+        mouse_pos = pygame.mouse.get_pos()
+        hover_idx = pygame.Rect(mouse_pos, (1, 1)).collidelist(self._rects)
+        for i, item in enumerate(self.items):
+            # Brighter panel if mouse is over item
+            panel = self._item_panel_hover if i == hover_idx else self._item_panel_normal
+            screen.blit(panel, item['rect'].topleft)
             
-            # Draw item name
-            name_text = self.font.render(item['name'], True, COLORS['white'])
+            # Draw item name and description
+            name_text, desc_text = self._item_text[i]
             screen.blit(name_text, (item['rect'].x + 10, item['rect'].y + 10))
-            
-            # Draw item description
-            desc_text = self.font.render(item['description'], True, COLORS['light_gray'])
             screen.blit(desc_text, (item['rect'].x + 10, item['rect'].y + 30))
             
             # Draw cost
             cost_text = self.font.render(f"Cost: {item['cost']}", True, 
-                                       COLORS['gold'] if self.game.coins >= item['cost'] else COLORS['red'])
+                                       COLOR_GOLD if self.game.coins >= item['cost'] else COLOR_RED)
             screen.blit(cost_text, (item['rect'].x + self.width - 80, item['rect'].y + 10))
     
     def handle_event(self, event):
@@ -151,15 +165,16 @@ class Shop:
                 return True
                 
             # Check if any shop item was clicked
-            for item in self.items:
-                if item['rect'].collidepoint(event.pos):
-                    if self.game.coins >= item['cost']:
-                        if item['action']():  # Call the action function
-                            self.game.coins -= item['cost']
-                            return True
-                    else:
-                        # Show "Can't afford" message
-                        print("Can't afford this item!")
+            idx = pygame.Rect(event.pos, (1, 1)).collidelist(self._rects)
+            if idx != -1:
+                item = self.items[idx]
+                if self.game.coins >= item['cost']:
+                    if item['action']():  # Call the action function
+                        self.game.coins -= item['cost']
                         return True
+                else:
+                    # Show "Can't afford" message
+                    print("Can't afford this item!")
+                    return True
                         
         return False
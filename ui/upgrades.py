@@ -1,7 +1,44 @@
 import random
+import logging
 import pygame
-from typing import Dict, List, Callable
+from collections import OrderedDict
+from typing import Dict, List
 from utils.constants import COLORS
+from utils.surfaces import convert_surface
+
+logger = logging.getLogger("TankGame.Upgrades")
+
+# Maximum number of rendered text surfaces kept by UpgradeSystem._render
+_TEXT_CACHE_SIZE = 64
+
+# Module-level bindings for the sampling fast path
+_sample = random.sample
+_choice = random.choice
+_randrange = random.randrange
+
+def _pick_distinct(population, k):
+    """Pick k distinct entries; for k <= 2 plain choice/rejection is cheaper than random.sample"""
+    n = len(population)
+    k = min(k, n)
+    if k <= 0:
+        return []
+    if k == 1:
+        return [_choice(population)]
+    if k == 2:
+        a = _randrange(n)
+        b = _randrange(n)
+        while b == a:
+            b = _randrange(n)
+        return [population[a], population[b]]
+    return _sample(population, k)
+
+# Upgrade id -> (indicator color, option title, option description)
+_UPGRADE_META = {
+    "damage": ((255, 0, 0), "Damage +10%", "Increases your attack damage"),               # Red for damage
+    "speed": ((0, 0, 255), "Speed +10%", "Increases your movement speed"),                # Blue for speed
+    "max_health": ((0, 255, 0), "Max Health +10%", "Increases your maximum health"),      # Green for health
+    "attack_speed": ((255, 255, 0), "Attack Speed +10%", "Increases your attack rate"),   # Yellow for attack speed
+}
 
 class UpgradeSystem:
     def __init__(self, colors, game):
@@ -10,6 +47,20 @@ class UpgradeSystem:
         self.available_upgrades = []
         self.show_upgrade_panel = False
         self.upgrade_buttons = []
+        self._shown = []  # Upgrades picked for the currently open panel
+        
+        # Panel fonts, created once instead of on every draw
+        pygame.font.init()  # Ensure font system is initialized
+        self._title_font = pygame.font.Font(None, 36)
+        self._option_font = pygame.font.Font(None, 28)
+        self._desc_font = pygame.font.Font(None, 20)
+        
+        # Rendered text surfaces keyed by (font, text, color), least recently used first
+        self._text_cache = OrderedDict()
+        
+        # Fully assembled panel, rebuilt after show_upgrades() or a window resize
+        self._panel_surface = None
+        self._panel_size = None
         
         # Attack types and their levels/stats
         self.attack_types = {
@@ -84,22 +135,50 @@ class UpgradeSystem:
         """Show upgrade options"""
         self.upgrades = upgrades
         self.show_upgrade_panel = True
-        print(f"Showing upgrades: {len(upgrades)} options available")  # Debug print
+        # Select 2 random upgrades to show, fixed until the panel is shown again
+        self._shown = _pick_distinct(upgrades, 2)
+        self._panel_surface = None
+        logger.debug("Showing upgrades: %d options available", len(upgrades))
+
+    def _render(self, font, text, color):
+        """Render text with antialiasing, reusing the surface if it was rendered before"""
+        key = (id(font), text, color)
+        surface = self._text_cache.get(key)
+        if surface is None:
+            surface = font.render(text, True, color)
+            self._text_cache[key] = surface
+            if len(self._text_cache) > _TEXT_CACHE_SIZE:
+                self._text_cache.popitem(last=False)
+        else:
+            self._text_cache.move_to_end(key)
+        return surface
 
     def hide_upgrades(self):
         """Hide the upgrade panel"""
         self.show_upgrade_panel = False
         self.available_upgrades = []
+        self._shown = []
+        self._panel_surface = None
 
     def draw_upgrade_panel(self, screen, window_width, window_height):
         """Draw the upgrade selection panel"""
         if not self.show_upgrade_panel:
             return
-            
-        # Draw semi-transparent background
+        
+        if self._panel_surface is None or self._panel_size != (window_width, window_height):
+            self._build_panel_surface(window_width, window_height)
+        screen.blit(self._panel_surface, (0, 0))
+
+    def _build_panel_surface(self, window_width, window_height):
+        """Render the whole upgrade panel into one surface and record the option rects"""
+        # Semi-transparent background covering the window
         overlay = pygame.Surface((window_width, window_height), pygame.SRCALPHA)
         overlay.fill((0, 0, 0, 180))  # Black with 70% opacity
-        screen.blit(overlay, (0, 0))
+        
+        # Local bindings for the option loop
+        draw_rect = pygame.draw.rect
+        blit = overlay.blit
+        render = self._render
         
         # Draw upgrade panel
         panel_width = 500
@@ -108,50 +187,31 @@ class UpgradeSystem:
         panel_y = window_height // 2 - panel_height // 2
         
         # Draw panel background
-        pygame.draw.rect(overlay, (30, 30, 50, 255), (panel_x, panel_y, panel_width, panel_height))
-        pygame.draw.rect(overlay, (0, 255, 255, 255), (panel_x, panel_y, panel_width, panel_height), 2)
+        draw_rect(overlay, (30, 30, 50, 255), (panel_x, panel_y, panel_width, panel_height))
+        draw_rect(overlay, (0, 255, 255, 255), (panel_x, panel_y, panel_width, panel_height), 2)
         
         # Draw title
-        font = pygame.font.Font(None, 36)
-        title = font.render("Level Up! Choose an Upgrade", True, (255, 255, 255))
+        title = render(self._title_font, "Level Up! Choose an Upgrade", (255, 255, 255))
         title_rect = title.get_rect(center=(window_width // 2, panel_y + 30))
-        screen.blit(title, title_rect)
+        blit(title, title_rect)
         
         # Clear previous upgrade rects
-        self.available_upgrades = []
+        avail = self.available_upgrades
+        avail.clear()
         
         # Draw upgrade options
-        if len(self.upgrades) > 0:
-            # Select 2 random upgrades to show
-            upgrades_to_show = random.sample(self.upgrades, min(2, len(self.upgrades)))
-            
+        if self._shown:
             option_height = 80
             option_width = 450
             option_margin = 10
             option_y = panel_y + 70
+            option_font = self._option_font
+            desc_font = self._desc_font
             
-            for i, upgrade in enumerate(upgrades_to_show):  # Show only 2 upgrades
-                # Determine color based on upgrade type
-                if upgrade == "damage":
-                    color = (255, 0, 0)  # Red for damage
-                    description = "Increases your attack damage"
-                    title_text = "Damage +10%"
-                elif upgrade == "speed":
-                    color = (0, 0, 255)  # Blue for speed
-                    description = "Increases your movement speed"
-                    title_text = "Speed +10%"
-                elif upgrade == "max_health":
-                    color = (0, 255, 0)  # Green for health
-                    description = "Increases your maximum health"
-                    title_text = "Max Health +10%"
-                elif upgrade == "attack_speed":
-                    color = (255, 255, 0)  # Yellow for attack speed
-                    description = "Increases your attack rate"
-                    title_text = "Attack Speed +10%"
-                else:
-                    color = (200, 200, 200)  # Gray for unknown
-                    description = "Unknown upgrade"
-                    title_text = f"{upgrade.capitalize()} +10%"
+            for i, upgrade in enumerate(self._shown):  # Show only 2 upgrades
+                # Determine color and text based on upgrade type (gray for unknown)
+                color, title_text, description = _UPGRADE_META.get(
+                    upgrade, ((200, 200, 200), f"{upgrade.capitalize()} +10%", "Unknown upgrade"))
                 
                 # Draw option background
                 option_rect = pygame.Rect(
@@ -160,25 +220,26 @@ class UpgradeSystem:
                     option_width,
                     option_height
                 )
-                pygame.draw.rect(screen, (50, 50, 70), option_rect)
-                pygame.draw.rect(screen, color, option_rect, 2)
+                draw_rect(overlay, (50, 50, 70), option_rect)
+                draw_rect(overlay, color, option_rect, 2)
                 
                 # Store the upgrade and its rect for click detection
-                self.available_upgrades.append((upgrade, option_rect))
+                avail.append((upgrade, option_rect))
                 
                 # Draw option title
-                option_font = pygame.font.Font(None, 28)
-                option_title = option_font.render(title_text, True, (255, 255, 255))
-                screen.blit(option_title, (option_rect.x + 10, option_rect.y + 10))
+                option_title = render(option_font, title_text, (255, 255, 255))
+                blit(option_title, (option_rect.x + 10, option_rect.y + 10))
                 
                 # Draw option description
-                desc_font = pygame.font.Font(None, 20)
-                desc_text = desc_font.render(description, True, (200, 200, 200))
-                screen.blit(desc_text, (option_rect.x + 10, option_rect.y + 40))
+                desc_text = render(desc_font, description, (200, 200, 200))
+                blit(desc_text, (option_rect.x + 10, option_rect.y + 40))
                 
                 # Draw color indicator
-                color_text = desc_font.render(f"Rect: <red({color[0]}, {color[1]}, {color[2]}, 100)>", True, (150, 150, 150))
-                screen.blit(color_text, (option_rect.x + 10, option_rect.y + 60))
+                color_text = render(desc_font, f"Rect: <red({color[0]}, {color[1]}, {color[2]}, 100)>", (150, 150, 150))
+                blit(color_text, (option_rect.x + 10, option_rect.y + 60))
+        
+        self._panel_surface = convert_surface(overlay, alpha=True)
+        self._panel_size = (window_width, window_height)
 
     def handle_upgrades(self, event, window_width, window_height, Button):
         """Handle upgrade events"""
@@ -192,14 +253,15 @@ class UpgradeSystem:
 
     def check_click(self, mouse_pos):
         """Check if an upgrade was clicked and return its type"""
-        print(f"Checking click at {mouse_pos}, buttons: {len(self.available_upgrades)}")  # Debug print
+        logger.debug("Checking click at %s, buttons: %d", mouse_pos, len(self.available_upgrades))
         
         if not self.show_upgrade_panel:
             return None
             
-        for upgrade, rect in self.available_upgrades:
+        ups = self.available_upgrades
+        for upgrade, rect in ups:
             if rect.collidepoint(mouse_pos):
-                print(f"Clicked on upgrade: {upgrade}")  # Debug print
+                logger.debug("Clicked on upgrade: %s", upgrade)
                 return upgrade
                 
         return None
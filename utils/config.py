@@ -1,6 +1,9 @@
 import json
 import os
+import copy
 import logging
+import functools
+from types import MappingProxyType
 
 # Default configuration values
 DEFAULT_CONFIG = {
@@ -58,6 +61,24 @@ DEFAULT_CONFIG = {
     }
 }
 
+# Read-only view of the defaults; callers that need a mutable config get a deep copy
+DEFAULT_CONFIG_RO = MappingProxyType(DEFAULT_CONFIG)
+
+# Last configuration loaded or saved; load_configuration serves it without touching disk
+_CACHED_CONFIG = None
+
+# Stat type -> config key holding its per-difficulty multipliers
+_MULTIPLIER_KEYS = {
+    "enemy_health": "enemy_health_multiplier",
+    "enemy_damage": "enemy_damage_multiplier",
+    "player_damage": "player_damage_multiplier",
+}
+
+# Flat {(difficulty, stat_type): multiplier} table for the config in _MULT_CACHE_OWNER
+_MULT_CACHE = {}
+_MULT_CACHE_OWNER = None
+
+@functools.lru_cache(maxsize=1)
 def get_config_path():
     """Get the path to the configuration file"""
     # Try to find the config in the game root directory
@@ -71,6 +92,10 @@ def load_configuration():
     Returns:
         dict: The loaded configuration dictionary
     """
+    global _CACHED_CONFIG
+    if _CACHED_CONFIG is not None:
+        return _CACHED_CONFIG
+    
     logger = logging.getLogger("TankGame.Config")
     config_path = get_config_path()
     
@@ -84,22 +109,26 @@ def load_configuration():
             logger.info(f"Configuration loaded from {config_path}")
             
             # Merge with default config to ensure all keys exist
-            merged_config = DEFAULT_CONFIG.copy()
+            merged_config = copy.deepcopy(DEFAULT_CONFIG)
             update_nested_dict(merged_config, loaded_config)
             
+            _CACHED_CONFIG = merged_config
+            _build_multiplier_cache(merged_config)
             return merged_config
             
         except Exception as e:
             logger.error(f"Error loading configuration: {e}")
             logger.info("Using default configuration")
-            save_configuration(DEFAULT_CONFIG)  # Save default config for next time
-            return DEFAULT_CONFIG
+            default_config = copy.deepcopy(DEFAULT_CONFIG)
+            save_configuration(default_config)  # Save default config for next time
+            return default_config
     else:
         # Create default config file
         logger.info(f"No configuration file found at {config_path}")
         logger.info("Creating default configuration file")
-        save_configuration(DEFAULT_CONFIG)
-        return DEFAULT_CONFIG
+        default_config = copy.deepcopy(DEFAULT_CONFIG)
+        save_configuration(default_config)
+        return default_config
 
 def save_configuration(config):
     """
@@ -111,6 +140,7 @@ def save_configuration(config):
     Returns:
         bool: True if successful, False otherwise
     """
+    global _CACHED_CONFIG
     logger = logging.getLogger("TankGame.Config")
     config_path = get_config_path()
     
@@ -119,6 +149,8 @@ def save_configuration(config):
             json.dump(config, f, indent=4)
         
         logger.info(f"Configuration saved to {config_path}")
+        _CACHED_CONFIG = config
+        _build_multiplier_cache(config)
         return True
     except Exception as e:
         logger.error(f"Error saving configuration: {e}")
@@ -126,7 +158,7 @@ def save_configuration(config):
 
 def update_nested_dict(base_dict, new_dict):
     """
-    Recursively update a nested dictionary with values from another dictionary.
+    Update a nested dictionary with values from another dictionary, merging nested dicts.
     
     Args:
         base_dict (dict): The base dictionary to update
@@ -135,13 +167,32 @@ def update_nested_dict(base_dict, new_dict):
     Returns:
         dict: The updated dictionary
     """
-    for key, value in new_dict.items():
-        if key in base_dict and isinstance(base_dict[key], dict) and isinstance(value, dict):
-            update_nested_dict(base_dict[key], value)
-        else:
-            base_dict[key] = value
+    # Walk nested levels with an explicit stack instead of recursing
+    stack = [(base_dict, new_dict)]
+    while stack:
+        base, new = stack.pop()
+        for key, value in new.items():
+            if key in base and isinstance(base[key], dict) and isinstance(value, dict):
+                stack.append((base[key], value))
+            else:
+                base[key] = value
     return base_dict
 
+def _build_multiplier_cache(config):
+    """
+    Flatten the per-difficulty multiplier tables of a config into one lookup dict.
+    
+    Args:
+        config (dict): The configuration dictionary to build the table from
+    """
+    global _MULT_CACHE, _MULT_CACHE_OWNER
+    _MULT_CACHE = {
+        (difficulty, stat_type): multiplier
+        for stat_type, key in _MULTIPLIER_KEYS.items()
+        for difficulty, multiplier in config.get(key, {}).items()
+    }
+    _MULT_CACHE_OWNER = config
+
 def get_difficulty_multiplier(config, stat_type):
     """
     Get the difficulty multiplier for a specific stat type.
@@ -154,13 +205,8 @@ def get_difficulty_multiplier(config, stat_type):
     Returns:
         float: The multiplier for the current difficulty level
     """
-    difficulty = config.get("difficulty", "normal")
-    
-    if stat_type == "enemy_health":
-        return config.get("enemy_health_multiplier", {}).get(difficulty, 1.0)
-    elif stat_type == "enemy_damage":
-        return config.get("enemy_damage_multiplier", {}).get(difficulty, 1.0)
-    elif stat_type == "player_damage":
-        return config.get("player_damage_multiplier", {}).get(difficulty, 1.0)
-    else:
-        return 1.0
+    # The table is rebuilt on load/save; other config dicts get their own table on first use
+    if config is not _MULT_CACHE_OWNER:
+        _build_multiplier_cache(config)
+    
+    return _MULT_CACHE.get((config.get("difficulty", "normal"), stat_type), 1.0)
@@ -6,6 +6,8 @@ These are organized by category for easier modification and reference.
 """
 
 import os
+import functools
+from types import MappingProxyType
 import pygame
 
 # Colors in RGB format
@@ -15,7 +17,7 @@ COLORS = {
     'black': (0, 0, 0),
     'red': (255, 0, 0),
     'green': (0, 255, 0),
-    'blue': (0, 0, 255),
+    'blue': (20, 120, 220),       # Was listed twice; this later value is the one in effect
     'yellow': (255, 255, 0),
     'cyan': (0, 255, 255),
     'magenta': (255, 0, 255),
@@ -61,13 +63,16 @@ COLORS = {
     # Additional UI element colors (keep legacy names for compatibility)
     'dark_green': (0, 100, 0),
     'dark_blue': (0, 0, 100),
-    'blue': (20, 120, 220),
     'purple': (150, 50, 200),
     'pink': (220, 100, 150),
     'orange': (240, 140, 40),
     'accent': (100, 200, 255),
 }
 
+# Module-level COLOR_<NAME> constants mirroring COLORS (e.g. COLOR_WHITE), which
+# skip the dict lookup in per-frame draw code
+globals().update({f"COLOR_{name.upper()}": color for name, color in COLORS.items()})
+
 # Base game mechanic constants
 BASE_XP_REQUIREMENT = 100  # Base XP needed to level up
 XP_LEVEL_MULTIPLIER = 1.2  # Multiplier for XP needed per level
@@ -161,22 +166,42 @@ DEFAULT_CONTROLS = {
     'pause': pygame.K_ESCAPE,
 }
 
-# UI Scale
-UI_SCALE = WINDOW_WIDTH / 1920
-BASE_FONT_SIZE = int(36 * UI_SCALE)
-
-# Button sizes
-BUTTON_SIZES = {
-    'large': (int(300 * UI_SCALE), int(60 * UI_SCALE)),
-    'medium': (int(200 * UI_SCALE), int(50 * UI_SCALE)),
-    'small': (int(150 * UI_SCALE), int(40 * UI_SCALE))
-}
+@functools.lru_cache(maxsize=8)
+def get_ui_constants(window_width):
+    """
+    Get the UI_SCALE-dependent constants for a window width (cached per width).
+    
+    Args:
+        window_width (int): Current window width in pixels
+    
+    Returns:
+        MappingProxyType: Read-only UI_SCALE, BASE_FONT_SIZE, BUTTON_SIZES and PADDING
+        for that width (shared between callers, so it must not be mutable)
+    """
+    ui_scale = window_width / 1920
+    return MappingProxyType({
+        'UI_SCALE': ui_scale,
+        'BASE_FONT_SIZE': int(36 * ui_scale),
+        # Button sizes
+        'BUTTON_SIZES': MappingProxyType({
+            'large': (int(300 * ui_scale), int(60 * ui_scale)),
+            'medium': (int(200 * ui_scale), int(50 * ui_scale)),
+            'small': (int(150 * ui_scale), int(40 * ui_scale))
+        }),
+        # Padding
+        'PADDING': int(20 * ui_scale),
+    })
 
-# Padding
-PADDING = int(20 * UI_SCALE)
+# UI Scale, button sizes and padding for the default window width
+_DEFAULT_UI = get_ui_constants(WINDOW_WIDTH)
+UI_SCALE = _DEFAULT_UI['UI_SCALE']
+BASE_FONT_SIZE = _DEFAULT_UI['BASE_FONT_SIZE']
+BUTTON_SIZES = _DEFAULT_UI['BUTTON_SIZES']
+PADDING = _DEFAULT_UI['PADDING']
 
 # Paths
 FONT_PATH = os.path.join(os.path.dirname(__file__), "..", "assets", "fonts", "Amiri-Regular.ttf")
+STAT_ICONS_PATH = os.path.join(os.path.dirname(__file__), "..", "assets", "Images", "stat_icons.png")
 
 # Game settings
 FIRST_WAVE_DELAY = 180  # 3 seconds at 60 FPS
@@ -5,8 +5,21 @@ import logging
 import traceback
 from datetime import datetime
 import time
+from math import isfinite
 from collections import deque
 
+# Number of recent frame times averaged by GameDebugger.get_fps
+FRAME_WINDOW = 60
+
+class _ForwardHandler(logging.Handler):
+    """Re-emit records through another logger (and so through its ancestors' handlers)"""
+    def __init__(self, target, level=logging.NOTSET):
+        super().__init__(level)
+        self.target = target
+        
+    def emit(self, record):
+        self.target.handle(record)
+
 # Use this class to disable debugging but keep the interface intact
 class DummyDebugger:
     def __init__(self):
@@ -74,48 +87,74 @@ class GameDebugger:
         self.last_error = None
         self.error_count = 0
         self.debug_info = []
-        self.frame_times = deque(maxlen=60)  # Store last 60 frame times
-        self.max_frame_times = 60  # Add this line to define max_frame_times
+        # Ring buffer of the last FRAME_WINDOW frame times with a running sum
+        self._ft = [0.0] * FRAME_WINDOW
+        self._ft_idx = 0
+        self._ft_sum = 0.0
+        self._ft_count = 0
         self.error_log = deque(maxlen=10)    # Store last 10 errors
         self.is_active = False
         self.start_time = time.time()
-        self.font = pygame.font.SysFont('monospace', 16)
+        self._start_perf = time.perf_counter()  # Reference point for error_log timestamps
+        self.font = None  # Created on the first enabled draw
         
         # Create logs directory if it doesn't exist
         self.logs_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'logs')
         os.makedirs(self.logs_dir, exist_ok=True)
         self.log_file = os.path.join(self.logs_dir, f"game_debug_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log")
-        logging.basicConfig(filename=self.log_file, level=logging.DEBUG)
+        
+        # Dedicated logger with its own file handler, attached only once per process
+        self.logger = logging.getLogger("TankGame.Debug")
+        file_handlers = [h for h in self.logger.handlers if isinstance(h, logging.FileHandler)]
+        if file_handlers:
+            self.log_file = file_handlers[0].baseFilename
+        else:
+            # delay=True: no file is created until the debugger actually logs something
+            fh = logging.FileHandler(self.log_file, delay=True)
+            fh.setLevel(logging.DEBUG)
+            self.logger.addHandler(fh)
+            self.logger.setLevel(logging.DEBUG)
+            # Keep per-frame debug lines in the debug log only, out of the root
+            # console / game.log handlers, but still pass warnings and errors up
+            self.logger.propagate = False
+            self.logger.addHandler(_ForwardHandler(logging.getLogger("TankGame"), logging.WARNING))
 
     def toggle(self):
         self.enabled = not self.enabled
         self.is_active = not self.is_active
-        logging.info(f"Debug mode: {'enabled' if self.enabled else 'disabled'}")
-        logging.info(f"Debug overlay {'enabled' if self.is_active else 'disabled'}")
+        self.logger.info(f"Debug mode: {'enabled' if self.enabled else 'disabled'}")
+        self.logger.info(f"Debug overlay {'enabled' if self.is_active else 'disabled'}")
 
     def log_error(self, error):
         self.last_error = error
         self.error_count += 1
-        error_trace = traceback.format_exc()
-        logging.error(f"Error #{self.error_count}:\n{error_trace}")
-        timestamp = time.strftime("%Y-%m-%d %H:%M:%S")
-        self.error_log.append((timestamp, str(error)))
-        logging.error(f"Game error: {error}")
+        # Errors are always recorded, but the traceback is only formatted while debugging
+        if self.enabled:
+            error_trace = traceback.format_exc()
+            self.logger.error(f"Error #{self.error_count}:\n{error_trace}")
+        # Raw monotonic timestamp; formatted only when displayed
+        self.error_log.append((time.perf_counter(), str(error)))
+        self.logger.error(f"Game error: {error}")
 
     def update_frame_time(self, dt):
+        if not self.enabled:
+            return
         self.frame_time = dt
-        self.frame_times.append(dt)
-        if len(self.frame_times) > self.max_frame_times:
-            self.frame_times.pop(0)
+        self._ft_sum += dt - self._ft[self._ft_idx]
+        self._ft[self._ft_idx] = dt
+        self._ft_idx = (self._ft_idx + 1) % FRAME_WINDOW
+        if self._ft_idx == 0:
+            self._ft_sum = sum(self._ft)  # Resync once per lap to stop float drift
+        self._ft_count = min(self._ft_count + 1, FRAME_WINDOW)
         if dt > 0.1:  # Frame took longer than 100ms
-            logging.warning(f"Performance warning: Frame took {dt*1000:.2f}ms")
+            self.logger.warning(f"Performance warning: Frame took {dt*1000:.2f}ms")
 
     def get_fps(self):
-        if not self.frame_times:
-            return 0
-        return 1.0 / (sum(self.frame_times) / len(self.frame_times))
+        return self._ft_count / self._ft_sum if self._ft_sum > 0 else 0
 
     def add_debug_info(self, info):
+        if not self.enabled:
+            return
         self.debug_info.append(info)
 
     def clear_debug_info(self):
@@ -124,6 +163,8 @@ class GameDebugger:
     def draw(self, surface):
         if not self.enabled:
             return
+        if self.font is None:
+            self.font = pygame.font.SysFont('monospace', 16)
 
         y = 10
         x = 10
@@ -142,26 +183,28 @@ class GameDebugger:
 
         # Draw last error if any
         if self.last_error:
+            when = f" [+{self.error_log[-1][0] - self._start_perf:.1f}s]" if self.error_log else ""
             error_text = self.font.render(
-                f"Last Error: {type(self.last_error).__name__}: {str(self.last_error)[:50]}...",
+                f"Last Error{when}: {type(self.last_error).__name__}: {str(self.last_error)[:50]}...",
                 True, (255, 0, 0))
             surface.blit(error_text, (x, y))
 
     def check_game_state(self, game):
         """Validate game state and objects"""
-        if self.enabled:
-            logging.debug(f"Current game state: {game.state}")
-            logging.debug(f"FPS: {1.0 / self.frame_time if self.frame_time > 0 else 0}")
+        if not self.enabled:
+            return True
+        self.logger.debug(f"Current game state: {game.state}")
+        self.logger.debug(f"FPS: {1.0 / self.frame_time if self.frame_time > 0 else 0}")
         try:
             # Check player state
             if game.player.health < 0:
                 raise ValueError("Player health cannot be negative")
             
-            # Check enemy positions
+            # Check enemy positions (non-numeric coordinates raise TypeError here)
             for enemy in game.enemies:
-                if not isinstance(enemy.pos[0], (int, float)) or \
-                   not isinstance(enemy.pos[1], (int, float)):
-                    raise ValueError(f"Invalid enemy position: {enemy.pos}")
+                pos = enemy.pos
+                if not (isfinite(pos[0]) and isfinite(pos[1])):
+                    raise ValueError(f"Invalid enemy position: {pos}")
 
             # Check projectile states
             if hasattr(game, 'projectiles'):
@@ -181,10 +224,10 @@ class GameDebugger:
         if not pygame.display.get_init():
             self.log_error("Display system lost initialization")
         
-        if len(self.frame_times) > 0:
-            avg_fps = 1.0 / (sum(self.frame_times) / len(self.frame_times))
+        if self._ft_count > 0:
+            avg_fps = self.get_fps()
             if avg_fps < 30:  # FPS dropped below 30
-                logging.warning(f"Performance warning: Average FPS: {avg_fps:.1f}")
+                self.logger.warning(f"Performance warning: Average FPS: {avg_fps:.1f}")
 
     def get_debug_info(self):
         return {
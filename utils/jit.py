@@ -0,0 +1,33 @@
+"""
+Optional Numba JIT support for Tank Game
+
+Pure-numeric helpers (ints, floats and NumPy arrays only, no game objects) can be
+decorated with cond_jit() so they are compiled by Numba when it is installed.
+Without Numba the decorator returns the function unchanged.
+"""
+
+try:
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:
+    njit = None
+    HAS_NUMBA = False
+
+def cond_jit(**kwargs):
+    """
+    Decorator factory that applies numba.njit(**kwargs) when Numba is available.
+    
+    Compiled functions should compare optional arguments against None rather than
+    relying on the truthiness of flags, which Numba types differently.
+    
+    Args:
+        **kwargs: Options passed through to numba.njit (e.g. cache=True)
+    
+    Returns:
+        callable: A decorator returning the compiled or the original function
+    """
+    def decorator(func):
+        if HAS_NUMBA:
+            return njit(**kwargs)(func)
+        return func
+    return decorator
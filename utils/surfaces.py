@@ -0,0 +1,16 @@
+import pygame
+
+def convert_surface(surface, alpha=False):
+    """
+    Convert a cached surface to the display pixel format so blits take the fast path.
+    
+    Args:
+        surface (pygame.Surface): The surface to convert
+        alpha (bool): Keep per-pixel alpha (convert_alpha) instead of an opaque convert
+    
+    Returns:
+        pygame.Surface: The converted surface, or the original one if no display mode is set yet
+    """
+    if pygame.display.get_surface() is None:
+        return surface
+    return surface.convert_alpha() if alpha else surface.convert()
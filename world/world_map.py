@@ -1,6 +1,37 @@
 import pygame
 import random
-from utils.constants import WINDOW_WIDTH, WINDOW_HEIGHT, COLORS, WORLD_SIZE
+import math
+from utils.constants import WINDOW_WIDTH, WINDOW_HEIGHT, COLORS, WORLD_SIZE, SPAWN_MARGIN
+from utils.surfaces import convert_surface
+from utils.jit import cond_jit
+
+# Default grid properties
+GRID_SIZE = 100
+GRID_LINE_WIDTH = 1
+
+# Cohen-Sutherland region out-codes
+_OUT_LEFT = 1
+_OUT_RIGHT = 2
+_OUT_TOP = 4
+_OUT_BOTTOM = 8
+
+@cond_jit(cache=True)
+def _grid_line_span(offset, extent, grid_size):
+    """
+    Screen position of the first visible grid line and how many lines fit in extent.
+    
+    Args:
+        offset (int): World -> screen offset along the axis
+        extent (int): Screen size along the axis
+        grid_size (int): Spacing between grid lines
+        
+    Returns:
+        tuple: (first, count)
+    """
+    first = offset % grid_size
+    if first >= extent:
+        return first, 0
+    return first, (extent - 1 - first) // grid_size + 1
 
 class WorldMap:
     """
@@ -13,6 +44,14 @@ class WorldMap:
     - Drawing the world grid and background
     """
     
+    # Fixed attribute set: cheaper per-frame attribute reads than an instance dict
+    __slots__ = (
+        'width', 'height', 'grid_color', 'ground_color', 'camera_x', 'camera_y',
+        'grid_size', 'grid_line_width', 'screen_width', 'screen_height',
+        '_rng', '_ox', '_oy', '_spawn_sides', '_spawn_sides_key',
+        '_bg_surface', '_bg_key',
+    )
+    
     def __init__(self, width=WORLD_SIZE, height=WORLD_SIZE):
         """
         Initialize the world map with the given dimensions.
@@ -33,22 +72,62 @@ class WorldMap:
         self.camera_y = height // 2
         
         # Grid properties
-        self.grid_size = 100
-        self.grid_line_width = 1
+        self.grid_size = GRID_SIZE
+        self.grid_line_width = GRID_LINE_WIDTH
+        
+        # Private RNG for spawn positions, independent of the global random state
+        self._rng = random.Random()
         
-        # Screen dimensions
+        # Screen dimensions, set through on_resize
         self.screen_width = 0
         self.screen_height = 0
         
-        # Cache screen dimensions on first draw
-        self.update_screen_dimensions = True
+        # World -> screen translation, refreshed when the camera or screen size changes
+        self._ox = 0
+        self._oy = 0
+        
+        # Offscreen spawn bands for the current camera, keyed by (screen_width, screen_height, margin)
+        self._spawn_sides = None
+        self._spawn_sides_key = None
+        
+        self._update_offsets()
+        
+        # Pre-rendered ground + grid, one grid cell larger than the screen so it can
+        # scroll; rebuilt if the screen size, grid size or colors change
+        self._bg_surface = None
+        self._bg_key = None
 
     def update_screen_dimensions_from_surface(self, surface):
         """Update cached screen dimensions from the provided surface"""
         if surface:
-            self.screen_width = surface.get_width()
-            self.screen_height = surface.get_height()
-            self.update_screen_dimensions = False
+            self.on_resize(surface.get_width(), surface.get_height())
+
+    def on_resize(self, width, height):
+        """
+        Update cached screen dimensions. Call once at startup and on every display resize.
+        
+        Args:
+            width (int): New screen width
+            height (int): New screen height
+        """
+        self.screen_width = width
+        self.screen_height = height
+        self._update_offsets()
+        
+        # A mode change can also change the display pixel format, so drop the cached
+        # background and let the next draw rebuild and convert() it for the new display
+        self._bg_surface = None
+        self._bg_key = None
+
+    def _update_offsets(self):
+        """Recompute the cached world -> screen offsets"""
+        ox = self.screen_width // 2 - self.camera_x
+        oy = self.screen_height // 2 - self.camera_y
+        if ox != self._ox or oy != self._oy:
+            # Spawn bands are relative to the view, so they move with it
+            self._spawn_sides = None
+        self._ox = ox
+        self._oy = oy
 
     def update_camera(self, target_x, target_y):
         """
@@ -61,6 +140,7 @@ class WorldMap:
         # Center camera on target, but respect world boundaries
         self.camera_x = target_x
         self.camera_y = target_y
+        self._update_offsets()
 
     def world_to_screen(self, world_x, world_y):
         """
@@ -73,9 +153,7 @@ class WorldMap:
         Returns:
             tuple: (screen_x, screen_y) coordinates
         """
-        screen_x = int(world_x - self.camera_x + self.screen_width // 2)
-        screen_y = int(world_y - self.camera_y + self.screen_height // 2)
-        return screen_x, screen_y
+        return int(world_x + self._ox), int(world_y + self._oy)
 
     def screen_to_world(self, screen_x, screen_y):
         """
@@ -88,9 +166,7 @@ class WorldMap:
         Returns:
             tuple: (world_x, world_y) coordinates
         """
-        world_x = int(screen_x + self.camera_x - self.screen_width // 2)
-        world_y = int(screen_y + self.camera_y - self.screen_height // 2)
-        return world_x, world_y
+        return int(screen_x - self._ox), int(screen_y - self._oy)
 
     def is_on_screen(self, world_x, world_y, buffer=50):
         """
@@ -104,10 +180,32 @@ class WorldMap:
         Returns:
             bool: True if point is on screen, False otherwise
         """
-        screen_x, screen_y = self.world_to_screen(world_x, world_y)
+        # Range test only, so no need to truncate to pixels
+        screen_x = world_x + self._ox
+        screen_y = world_y + self._oy
         return (-buffer <= screen_x <= self.screen_width + buffer and
                 -buffer <= screen_y <= self.screen_height + buffer)
 
+    def world_to_screen_batch(self, xs, ys):
+        """
+        Convert many world coordinates to screen coordinates in one pass.
+        
+        Accepts NumPy arrays (vectorized, returns int32 arrays) or plain sequences
+        (returns lists of ints).
+        
+        Args:
+            xs: X coordinates in world space
+            ys: Y coordinates in world space
+            
+        Returns:
+            tuple: (screen_xs, screen_ys)
+        """
+        off_x = self._ox
+        off_y = self._oy
+        if hasattr(xs, 'astype'):
+            return (xs + off_x).astype('int32'), (ys + off_y).astype('int32')
+        return [int(x + off_x) for x in xs], [int(y + off_y) for y in ys]
+
     def check_boundaries(self, entity):
         """
         Check if an entity is trying to move outside world boundaries and adjust position if needed.
@@ -150,6 +248,67 @@ class WorldMap:
             
         return adjusted
 
+    def visible_mask_soa(self, positions, buffer=50):
+        """
+        Visibility mask for a packed position buffer.
+        
+        Systems that keep their entity positions in one (N, 2) array can cull them all
+        with a single call instead of one is_on_screen call per entity.
+        
+        Args:
+            positions: (N, 2) NumPy array of world positions, or a sequence of (x, y) pairs
+            buffer (int): Extra margin to consider around the screen
+            
+        Returns:
+            Boolean mask (array for NumPy input, list otherwise)
+        """
+        # Range test on the untruncated screen positions, matching is_on_screen
+        off_x = self._ox
+        off_y = self._oy
+        max_x = self.screen_width + buffer
+        max_y = self.screen_height + buffer
+        if hasattr(positions, 'astype'):
+            sx = positions[:, 0] + off_x
+            sy = positions[:, 1] + off_y
+            return (sx >= -buffer) & (sx <= max_x) & (sy >= -buffer) & (sy <= max_y)
+        
+        return [-buffer <= pos[0] + off_x <= max_x and -buffer <= pos[1] + off_y <= max_y
+                for pos in positions]
+
+    def apply_boundaries_soa(self, positions, sizes):
+        """
+        Clamp a packed position buffer to the world boundaries in place.
+        
+        Args:
+            positions: (N, 2) NumPy array of world positions (integer arrays are clamped
+                to truncated bounds), or a sequence of mutable [x, y] pairs
+            sizes: Entity sizes matching positions
+            
+        Returns:
+            Boolean mask of which positions were adjusted
+        """
+        if hasattr(positions, 'astype'):
+            half = sizes / 2
+            old = positions.copy()
+            # Bounds are float; let clip write them back into integer arrays too
+            positions[:, 0].clip(half, self.width - half, out=positions[:, 0], casting='unsafe')
+            positions[:, 1].clip(half, self.height - half, out=positions[:, 1], casting='unsafe')
+            return (positions != old).any(axis=1)
+        
+        width = self.width
+        height = self.height
+        adjusted = []
+        for pos, size in zip(positions, sizes):
+            half = size / 2
+            x = min(max(pos[0], half), width - half)
+            y = min(max(pos[1], half), height - half)
+            changed = x != pos[0] or y != pos[1]
+            if changed:
+                pos[0] = x
+                pos[1] = y
+            adjusted.append(changed)
+        return adjusted
+
     def draw(self, surface):
         """
         Draw the world map (background and grid).
@@ -157,60 +316,152 @@ class WorldMap:
         Args:
             surface (pygame.Surface): Surface to draw on
         """
-        # Update screen dimensions if needed
-        if self.update_screen_dimensions:
-            self.update_screen_dimensions_from_surface(surface)
+        # Draw background and grid lines together from the cached tile
+        self.draw_cached_background(surface)
+
+    def _bg_cache_key(self):
+        """Everything the pre-rendered background depends on"""
+        return (self.screen_width, self.screen_height, self.grid_size,
+                self.grid_line_width, self.ground_color, self.grid_color)
+
+    def _build_bg_surface(self):
+        """
+        Render the ground fill with a grid line at every multiple of grid_size into a
+        surface one grid cell larger than the screen in each direction.
+        """
+        grid_size = self.grid_size
+        width = self.screen_width + grid_size
+        height = self.screen_height + grid_size
         
-        # Draw the background first
-        self.draw_background(surface)
+        # Opaque (no SRCALPHA) so convert() gives the display format's fast blit path
+        bg = pygame.Surface((width, height))
+        bg.fill(self.ground_color)
+        self._draw_grid_lines(bg, 0, 0)
         
-        # Draw the grid lines
-        self.draw_grid(surface)
+        self._bg_surface = convert_surface(bg)
+        self._bg_key = self._bg_cache_key()
 
-    def draw_background(self, surface):
+    def draw_cached_background(self, surface):
         """
-        Draw the world background.
+        Draw the background and grid with a single blit of the pre-rendered surface.
+        
+        The grid is translation-invariant modulo grid_size, so only the scroll offset
+        of the blit depends on the camera.
         
         Args:
             surface (pygame.Surface): Surface to draw on
         """
-        # Fill background with ground color
-        surface.fill(self.ground_color)
+        if self._bg_key != self._bg_cache_key():
+            self._build_bg_surface()
         
-    def draw_grid(self, surface):
+        # Screen position of a world-space grid line, pulled back into [-grid_size, 0)
+        grid_size = self.grid_size
+        surface.blit(self._bg_surface, (math.floor(self._ox) % grid_size - grid_size,
+                                        math.floor(self._oy) % grid_size - grid_size))
+
+    @staticmethod
+    def draw_line_clipped(surface, color, p0, p1, width=1):
         """
-        Draw the world grid.
+        Draw a line after clipping it to the surface (Cohen-Sutherland).
+        
+        pygame.draw.line gets very slow when endpoints lie far outside the surface, so
+        anything drawing lines from world_to_screen results should go through here.
+        The grid does not use it: its lines are generated already inside the surface.
         
         Args:
             surface (pygame.Surface): Surface to draw on
+            color: Line color
+            p0 (tuple): Start point in screen space
+            p1 (tuple): End point in screen space
+            width (int): Line width
+            
+        Returns:
+            pygame.Rect or None: Affected area, or None if the line is entirely off-surface
         """
-        # Calculate grid lines positions
-        start_x = (self.camera_x // self.grid_size) * self.grid_size
-        start_y = (self.camera_y // self.grid_size) * self.grid_size
-        
-        # Draw vertical grid lines
-        for x in range(start_x - self.screen_width, start_x + self.screen_width * 2, self.grid_size):
-            screen_x, _ = self.world_to_screen(x, 0)
-            if 0 <= screen_x <= self.screen_width:
-                pygame.draw.line(
-                    surface,
-                    self.grid_color,
-                    (screen_x, 0),
-                    (screen_x, self.screen_height),
-                    self.grid_line_width
-                )
-        
-        # Draw horizontal grid lines
-        for y in range(start_y - self.screen_height, start_y + self.screen_height * 2, self.grid_size):
-            _, screen_y = self.world_to_screen(0, y)
-            if 0 <= screen_y <= self.screen_height:
-                pygame.draw.line(
-                    surface,
-                    self.grid_color,
-                    (0, screen_y),
-                    (self.screen_width, screen_y),
-                    self.grid_line_width
-                )
+        max_x = surface.get_width() - 1
+        max_y = surface.get_height() - 1
+        x0, y0 = p0
+        x1, y1 = p1
+        
+        code0 = (x0 < 0) | ((x0 > max_x) << 1) | ((y0 < 0) << 2) | ((y0 > max_y) << 3)
+        code1 = (x1 < 0) | ((x1 > max_x) << 1) | ((y1 < 0) << 2) | ((y1 > max_y) << 3)
+        
+        while code0 | code1:
+            # Both endpoints share an outside region: nothing visible
+            if code0 & code1:
+                return None
+            
+            # Move the endpoint that is outside onto the clip edge it crosses
+            code = code0 or code1
+            if code & _OUT_BOTTOM:
+                x = x0 + (x1 - x0) * (max_y - y0) / (y1 - y0)
+                y = max_y
+            elif code & _OUT_TOP:
+                x = x0 + (x1 - x0) * (0 - y0) / (y1 - y0)
+                y = 0
+            elif code & _OUT_RIGHT:
+                y = y0 + (y1 - y0) * (max_x - x0) / (x1 - x0)
+                x = max_x
+            else:
+                y = y0 + (y1 - y0) * (0 - x0) / (x1 - x0)
+                x = 0
+            
+            if code == code0:
+                x0, y0 = x, y
+                code0 = (x0 < 0) | ((x0 > max_x) << 1) | ((y0 < 0) << 2) | ((y0 > max_y) << 3)
+            else:
+                x1, y1 = x, y
+                code1 = (x1 < 0) | ((x1 > max_x) << 1) | ((y1 < 0) << 2) | ((y1 > max_y) << 3)
+        
+        return pygame.draw.line(surface, color, (round(x0), round(y0)), (round(x1), round(y1)), width)
+
+    def _draw_grid_lines(self, surface, off_x, off_y):
+        """
+        Draw the grid lines that fall inside surface.
+        
+        Args:
+            surface (pygame.Surface): Surface to draw on
+            off_x (int): World -> surface X offset
+            off_y (int): World -> surface Y offset
+        """
+        screen_width, screen_height = surface.get_size()
+        
+        # Nothing would show: invisible lines, or an empty surface
+        if (self.grid_line_width <= 0 or self.grid_color == self.ground_color or
+                screen_width <= 0 or screen_height <= 0):
+            return
+        
+        # Hoist per-line lookups out of the loops
+        draw_lines = pygame.draw.lines
+        grid_color = self.grid_color
+        grid_size = self.grid_size
+        line_width = self.grid_line_width
+        
+        # Iterate only the lines inside the surface
+        first_x, count_x = _grid_line_span(off_x, screen_width, grid_size)
+        first_y, count_y = _grid_line_span(off_y, screen_height, grid_size)
+        
+        # One zigzag polyline per direction: consecutive grid lines are joined by
+        # connectors pushed outside the surface by more than half the line width,
+        # so none of their thickness lands on it and only the grid lines show
+        pad = line_width // 2 + 1
+        if count_x:
+            points = []
+            near, far = -pad, screen_height - 1 + pad
+            for screen_x in range(first_x, first_x + count_x * grid_size, grid_size):
+                points.append((screen_x, near))
+                points.append((screen_x, far))
+                near, far = far, near
+            draw_lines(surface, grid_color, False, points, line_width)
+        
+        if count_y:
+            points = []
+            near, far = -pad, screen_width - 1 + pad
+            for screen_y in range(first_y, first_y + count_y * grid_size, grid_size):
+                points.append((near, screen_y))
+                points.append((far, screen_y))
+                near, far = far, near
+            draw_lines(surface, grid_color, False, points, line_width)
 
     def get_random_position(self, margin=100):
         """
@@ -222,11 +473,45 @@ class WorldMap:
         Returns:
             tuple: (x, y) coordinates
         """
-        x = random.randint(margin, self.width - margin)
-        y = random.randint(margin, self.height - margin)
+        randrange = self._rng.randrange
+        x = randrange(margin, self.width - margin + 1)
+        y = randrange(margin, self.height - margin + 1)
         return x, y
 
-    def get_random_position_offscreen(self, screen_width, screen_height, margin=250):
+    def _build_spawn_sides(self, screen_width, screen_height, margin):
+        """
+        Compute the (x_lo, x_hi, y_lo, y_hi) spawn band for each side of the view.
+        
+        Args:
+            screen_width (int): Width of the screen
+            screen_height (int): Height of the screen
+            margin (int): Minimum distance from screen edge
+        """
+        # Calculate screen boundaries in world coordinates; the camera follows the
+        # (float) player position, but randrange needs integer bounds
+        camera_x = int(self.camera_x)
+        camera_y = int(self.camera_y)
+        min_x = camera_x - screen_width // 2
+        max_x = camera_x + screen_width // 2
+        min_y = camera_y - screen_height // 2
+        max_y = camera_y + screen_height // 2
+        
+        # Ensure we stay within world boundaries
+        world_min_x = max(0, min_x - margin * 2)
+        world_max_x = min(self.width, max_x + margin * 2)
+        world_min_y = max(0, min_y - margin * 2)
+        world_max_y = min(self.height, max_y + margin * 2)
+        
+        # Indexed by side: 0=top, 1=right, 2=bottom, 3=left
+        self._spawn_sides = (
+            (world_min_x, world_max_x, world_min_y, min_y - margin),  # Top
+            (max_x + margin, world_max_x, world_min_y, world_max_y),  # Right
+            (world_min_x, world_max_x, max_y + margin, world_max_y),  # Bottom
+            (world_min_x, min_x - margin, world_min_y, world_max_y),  # Left
+        )
+        self._spawn_sides_key = (screen_width, screen_height, margin)
+
+    def get_random_position_offscreen(self, screen_width, screen_height, margin=SPAWN_MARGIN):
         """
         Get a random position outside the screen but within the world.
         
@@ -239,33 +524,21 @@ class WorldMap:
             tuple: (x, y) coordinates
         """
         # Determine which side to spawn from (0=top, 1=right, 2=bottom, 3=left)
-        side = random.randint(0, 3)
+        randrange = self._rng.randrange
+        side = randrange(4)
         
-        # Calculate screen boundaries in world coordinates
-        min_x = self.camera_x - screen_width // 2
-        max_x = self.camera_x + screen_width // 2
-        min_y = self.camera_y - screen_height // 2
-        max_y = self.camera_y + screen_height // 2
+        # Spawn bands only change when the camera moves (which clears them) or the
+        # caller asks for a different view size / margin
+        if self._spawn_sides is None or self._spawn_sides_key != (screen_width, screen_height, margin):
+            self._build_spawn_sides(screen_width, screen_height, margin)
+        x_lo, x_hi, y_lo, y_hi = self._spawn_sides[side]
         
-        # Ensure we stay within world boundaries
-        world_min_x = max(0, min_x - margin * 2)
-        world_max_x = min(self.width, max_x + margin * 2)
-        world_min_y = max(0, min_y - margin * 2)
-        world_max_y = min(self.height, max_y + margin * 2)
+        # Camera near a world edge leaves no room on that side
+        if x_hi < x_lo or y_hi < y_lo:
+            return self.get_random_position()
         
-        # Generate position based on chosen side
-        if side == 0:  # Top
-            x = random.randint(world_min_x, world_max_x)
-            y = random.randint(world_min_y, min_y - margin)
-        elif side == 1:  # Right
-            x = random.randint(max_x + margin, world_max_x)
-            y = random.randint(world_min_y, world_max_y)
-        elif side == 2:  # Bottom
-            x = random.randint(world_min_x, world_max_x)
-            y = random.randint(max_y + margin, world_max_y)
-        else:  # Left
-            x = random.randint(world_min_x, min_x - margin)
-            y = random.randint(world_min_y, world_max_y)
+        x = randrange(x_lo, x_hi + 1)
+        y = randrange(y_lo, y_hi + 1)
         
         # Validate and clamp position
         x = max(0, min(x, self.width))